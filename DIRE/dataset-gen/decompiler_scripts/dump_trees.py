@@ -19,6 +19,8 @@ sentinel_vars = re.compile('@@VAR_[0-9]+')
 class RenamedGraphBuilder(GraphBuilder):
     def __init__(self, cg, func, addresses):
         self.func = func
+        # Fetched once; renaming only mutates the entries in place
+        self.lvars = func.get_lvars()
         self.addresses = addresses
         super(RenamedGraphBuilder, self).__init__(cg)
 
@@ -28,9 +30,8 @@ class RenamedGraphBuilder(GraphBuilder):
         if not sentinel_vars.match(original_name):
             # Get new name of variable
             addresses = frozenset(self.addresses[original_name])
-            if addresses in varmap and varmap[addresses] != '::NONE::':
-                new_name = varmap[addresses]
-            else:
+            new_name = varmap.get(addresses, '::NONE::')
+            if new_name == '::NONE::':
                 new_name = original_name
             # Save names
             print("Renaming %s to %s" % (original_name, new_name))
@@ -42,7 +43,7 @@ class RenamedGraphBuilder(GraphBuilder):
     def visit_expr(self, e):
         global var_id
         if e.op is ida_hexrays.cot_var:
-            self.visit_var(self.func.get_lvars()[e.v.idx])
+            self.visit_var(self.lvars[e.v.idx])
         return self.process(e)
 
 class AddressCollector:
@@ -51,13 +52,13 @@ class AddressCollector:
         self.addresses = defaultdict(set)
 
     def collect(self):
-        for item in self.cg.items:
+        # Node numbers are indices into cg.items
+        for item_id, item in enumerate(self.cg.items):
             if item.op is ida_hexrays.cot_var:
                 name = get_expr_name(item)
                 if item.ea != UNDEF_ADDR:
                     self.addresses[name].add(item.ea)
                 else:
-                    item_id = next(b for a, b in self.cg.reverse if a == item)
                     ea = self.cg.get_pred_ea(item_id)
                     if ea != UNDEF_ADDR:
                         self.addresses[name].add(ea)
@@ -109,10 +110,8 @@ def func(ea):
     function_info = dict()
     function_info["function"] = function_name
     function_info["ast"] = new_graph.json_tree(0)
-    raw_code = ""
-    for line in cfunc.get_pseudocode():
-        raw_code += idaapi.tag_remove(line.line) + '\n'
-    function_info["raw_code"] = raw_code
+    function_info["raw_code"] = "".join(
+        idaapi.tag_remove(line.line) + '\n' for line in cfunc.get_pseudocode())
     return function_info
 
 class custom_action_handler(ida_kernwin.action_handler_t):
@@ -9,6 +9,12 @@ UNDEF_ADDR = 0xFFFFFFFFFFFFFFFF
 
 hexrays_vars = re.compile("^(v|a)[0-9]+$")
 
+# ctree ops whose node carries its printed name (see CFuncGraph.json_tree)
+NAMED_LEAF_OPS = frozenset([
+    ida_hexrays.cot_num,
+    ida_hexrays.cot_str,
+    ida_hexrays.cot_helper])
+
 def get_expr_name(expr):
     name = expr.print1(None)
     name = ida_lines.tag_remove(name)
@@ -18,7 +24,7 @@ def get_expr_name(expr):
 class CFuncGraph:
     def __init__(self, highlight):
         self.items = [] # list of citem_t
-        self.reverse = [] # citem_t -> node #
+        self.node_ids = {} # citem_t obj_id -> node #
         self.succs = [] # list of lists of next nodes
         self.preds = [] # list of lists of previous nodes
         self.highlight = highlight
@@ -40,17 +46,8 @@ class CFuncGraph:
 
     def add_node(self):
         n = self.size()
-
-        def resize(array, new_size):
-            if new_size > len(array):
-                while len(array) < new_size:
-                    array.append([])
-            else:
-                array = array[:new_size]
-            return array
-
-        self.preds = resize(self.preds, n+1)
-        self.succs = resize(self.succs, n+1)
+        self.preds.append([])
+        self.succs.append([])
         return n
 
     def add_edge(self, x, y):
@@ -108,41 +105,47 @@ class CFuncGraph:
         # Each node has a unique ID
         node_info = { "node_id" : n }
         item = self.items[n]
+        # Each attribute access crosses the SWIG boundary, so read these once
+        op = item.op
+        ea = item.ea
+        is_expr = item.is_expr()
+        # cexpr is only meaningful (and only used below) for expressions
+        expr = item.cexpr if is_expr else None
         # This is the type of ctree node
-        node_info["node_type"] = ida_hexrays.get_ctype_name(item.op)
+        node_info["node_type"] = ida_hexrays.get_ctype_name(op)
         # This is the type of the data (in C-land)
-        if item.is_expr() and not item.cexpr.type.empty():
-            node_info["type"] = item.cexpr.type._print()
-        node_info["address"] = "%08X" % item.ea
-        if item.ea == UNDEF_ADDR:
+        if is_expr:
+            expr_type = expr.type
+            if not expr_type.empty():
+                node_info["type"] = expr_type._print()
+        node_info["address"] = "%08X" % ea
+        if ea == UNDEF_ADDR:
             node_info["parent_address"] = "%08X" % self.get_pred_ea(n)
         # Specific info for different node types
-        if item.op == ida_hexrays.cot_ptr:
-            node_info["pointer_size"] = item.cexpr.ptrsize
-        elif item.op == ida_hexrays.cot_memptr:
+        if op == ida_hexrays.cot_ptr:
+            node_info["pointer_size"] = expr.ptrsize
+        elif op == ida_hexrays.cot_memptr:
             node_info.update({
-                "pointer_size": item.cexpr.ptrsize,
-                "m": item.cexpr.m
+                "pointer_size": expr.ptrsize,
+                "m": expr.m
                 })
-        elif item.op == ida_hexrays.cot_memref:
-            node_info["m"] = item.cexpr.m
-        elif item.op == ida_hexrays.cot_obj:
+        elif op == ida_hexrays.cot_memref:
+            node_info["m"] = expr.m
+        elif op == ida_hexrays.cot_obj:
             node_info.update({
-                "name": get_expr_name(item.cexpr),
-                "ref_width": item.cexpr.refwidth
+                "name": get_expr_name(expr),
+                "ref_width": expr.refwidth
             })
-        elif item.op == ida_hexrays.cot_var:
-            _, var_id, old_name, new_name = get_expr_name(item.cexpr).split("@@")
+        elif op == ida_hexrays.cot_var:
+            _, var_id, old_name, new_name = get_expr_name(expr).split("@@")
             node_info.update({
                 "var_id": var_id,
                 "old_name": old_name,
                 "new_name": new_name,
-                "ref_width": item.cexpr.refwidth
+                "ref_width": expr.refwidth
             })
-        elif item.op in [ida_hexrays.cot_num,
-                         ida_hexrays.cot_str,
-                         ida_hexrays.cot_helper]:
-            node_info["name"] = get_expr_name(item.cexpr)
+        elif op in NAMED_LEAF_OPS:
+            node_info["name"] = get_expr_name(expr)
         # Get info for children of this node
         successors = []
         x_successor = None
@@ -151,22 +154,23 @@ class CFuncGraph:
         for i in range(self.nsucc(n)):
             successors.append(self.succ(n, i))
         successor_trees = []
-        if item.is_expr():
-            if item.x:
+        if is_expr:
+            x, y, z = item.x, item.y, item.z
+            if x:
                 for s in successors:
-                    if item.x == self.items[s]:
+                    if x == self.items[s]:
                         successors.remove(s)
                         x_successor = self.json_tree(s)
                         break
-            if item.y:
+            if y:
                 for s in successors:
-                    if item.y == self.items[s]:
+                    if y == self.items[s]:
                         successors.remove(s)
                         y_successor = self.json_tree(s)
                         break
-            if item.z:
+            if z:
                 for s in successors:
-                    if item.z == self.items[s]:
+                    if z == self.items[s]:
                         successors.remove(s)
                         z_successor = self.json_tree(s)
                         break
@@ -210,10 +214,8 @@ class GraphBuilder(ida_hexrays.ctree_parentee_t):
 
     def add_node(self, i):
         n = self.cg.add_node()
-        if n <= len(self.cg.items):
-            self.cg.items.append(i)
-        self.cg.items[n] = i
-        self.cg.reverse.append((i, n))
+        self.cg.items.append(i)
+        self.cg.node_ids.setdefault(i.obj_id, n)
         return n
 
     def process(self, i):
@@ -222,11 +224,7 @@ class GraphBuilder(ida_hexrays.ctree_parentee_t):
             return n
         if len(self.parents) > 1:
             lp = self.parents.back().obj_id
-            for k, v in self.cg.reverse:
-                if k.obj_id == lp:
-                    p = v
-                    break
-            self.cg.add_edge(p, n)
+            self.cg.add_edge(self.cg.node_ids[lp], n)
         return 0
 
     def visit_insn(self, i):
@@ -1,5 +1,6 @@
 from collections import OrderedDict
 from io import StringIO
+import sys
 import ujson as json
 from typing import Dict, List
 import numpy as np
@@ -14,7 +15,8 @@ class SyntaxNode(object):
     """represent a node on an AST"""
     def __init__(self, node_id, node_type, address=None, children: List=None, named_fields: Dict=None):
         self.node_id = node_id
-        self.node_type = node_type
+        # a handful of node types repeat across every tree in the dataset
+        self.node_type = sys.intern(node_type)
         self.address = address
         self.children = []
         self.parent = None
@@ -17,6 +17,8 @@ sentinel_vars = re.compile('@@VAR_[0-9]+')
 class RenamedGraphBuilder(GraphBuilder):
     def __init__(self, cg, func):
         self.func = func
+        # Fetched once; renaming only mutates the entries in place
+        self.lvars = func.get_lvars()
         super(RenamedGraphBuilder, self).__init__(cg)
 
     def visit_expr(self, e):
@@ -28,7 +30,7 @@ class RenamedGraphBuilder(GraphBuilder):
                 # Save names
                 varnames[var_id] = (original_name, original_name)
                 # Rename variables to @@VAR_[id]@@[orig name]@@[orig name]
-                self.func.get_lvars()[e.v.idx].name = \
+                self.lvars[e.v.idx].name = \
                     '@@VAR_' + str(var_id) + '@@' + original_name + '@@' + original_name
                 var_id += 1
         return self.process(e)
@@ -39,13 +41,13 @@ class AddressCollector:
         self.addresses = defaultdict(set)
 
     def collect(self):
-        for item in self.cg.items:
+        # Node numbers are indices into cg.items
+        for item_id, item in enumerate(self.cg.items):
             if item.op is ida_hexrays.cot_var:
                 name = get_expr_name(item)
                 if item.ea != UNDEF_ADDR:
                     self.addresses[name].add(item.ea)
                 else:
-                    item_id = next(b for a, b in self.cg.reverse if a == item)
                     ea = self.cg.get_pred_ea(item_id)
                     if ea != UNDEF_ADDR:
                         self.addresses[name].add(ea)
@@ -86,10 +88,8 @@ def func(ea):
     function_info = dict()
     function_info["function"] = function_name
     function_info["ast"] = new_graph.json_tree(0)
-    raw_code = ""
-    for line in cfunc.get_pseudocode():
-        raw_code += idaapi.tag_remove(line.line) + '\n'
-    function_info["raw_code"] = raw_code
+    function_info["raw_code"] = "".join(
+        idaapi.tag_remove(line.line) + '\n' for line in cfunc.get_pseudocode())
     return function_info
 
 class custom_action_handler(ida_kernwin.action_handler_t):
@@ -106,7 +106,7 @@ class collect_vars(custom_action_handler):
                 for ea in Functions():
                     try:
                         info = func(ea)
-                        writer.write(func(ea))
+                        writer.write(info)
                     except ida_hexrays.DecompilationFailure:
                         continue
         print('Vars collected.')
@@ -112,10 +112,8 @@ def func(ea, vuu):
     function_info = dict()
     function_info["function"] = function_name
     function_info["ast"] = new_graph.json_tree(0)
-    raw_code = ""
-    for line in cfunc.get_pseudocode():
-        raw_code += idaapi.tag_remove(line.line) + '\n'
-    function_info["raw_code"] = raw_code
+    function_info["raw_code"] = "".join(
+        idaapi.tag_remove(line.line) + '\n' for line in cfunc.get_pseudocode())
     return function_info, cfunc
 
 class predict_names_ah_t(idaapi.action_handler_t):